@@ -2,93 +2,221 @@
 Configuration management for Teamcenter Easy Plan AI Agent
 """
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
-from dotenv import load_dotenv
+from typing import Any, Dict, List, Optional
 
-# Load environment variables from .env file
-load_dotenv()
 
-
-class Config:
-    """Configuration class for the Teamcenter Easy Plan AI Agent"""
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Environment-derived settings, parsed once by get_settings()"""
 
     # Project Paths
-    PROJECT_ROOT = Path(__file__).parent
-    DATA_DIR = PROJECT_ROOT / os.getenv("DATA_DIRECTORY", "data")
-    DOCUMENTS_DIR = PROJECT_ROOT / os.getenv("DOCUMENTS_DIRECTORY", "documents")
-    WEB_SOURCES_DIR = PROJECT_ROOT / os.getenv("WEB_SOURCES_DIRECTORY", "web_sources")
-    EXPERIMENTS_DIR = PROJECT_ROOT / "experiments"
-    TESTS_DIR = PROJECT_ROOT / "tests"
-
-    # Ensure directories exist
-    DATA_DIR.mkdir(exist_ok=True)
-    DOCUMENTS_DIR.mkdir(exist_ok=True)
-    WEB_SOURCES_DIR.mkdir(exist_ok=True)
-    (DATA_DIR / "vectors").mkdir(exist_ok=True)
-    (DATA_DIR / "web_content").mkdir(exist_ok=True)
-    (DATA_DIR / "web_content" / "forums").mkdir(exist_ok=True)
-    (DATA_DIR / "web_content" / "documentation").mkdir(exist_ok=True)
-    (DATA_DIR / "web_content" / "tutorials").mkdir(exist_ok=True)
-
-    # API Keys (Required)
-    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-    LANGFUSE_PUBLIC_KEY = os.getenv("LANGFUSE_PUBLIC_KEY")
-    LANGFUSE_SECRET_KEY = os.getenv("LANGFUSE_SECRET_KEY")
-    LANGFUSE_HOST = os.getenv("LANGFUSE_HOST", "https://cloud.langfuse.com")
-
-    # Optional API Keys for fallback models
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+    project_root: Path
+    data_dir: Path
+    documents_dir: Path
+    web_sources_dir: Path
+    experiments_dir: Path
+    tests_dir: Path
+
+    # API Keys
+    anthropic_api_key: Optional[str]
+    langfuse_public_key: Optional[str]
+    langfuse_secret_key: Optional[str]
+    langfuse_host: str
+    openai_api_key: Optional[str]
+    google_api_key: Optional[str]
 
     # Vector Store Settings
-    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-    FAISS_INDEX_TYPE = "IndexFlatL2"
-    CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "800"))
-    CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "100"))
+    embedding_model: str
+    faiss_index_type: str
+    faiss_nprobe: int
+    chunk_size: int
+    chunk_overlap: int
 
     # RAG Pipeline Settings
-    TOP_K_RETRIEVAL = int(os.getenv("TOP_K_RETRIEVAL", "5"))
-    MAX_CONTEXT_LENGTH = int(os.getenv("MAX_CONTEXT_LENGTH", "4000"))
-    CONVERSATION_MEMORY_LIMIT = 10
-    WEB_CONTENT_WEIGHT = 0.7  # Relative weight of web content vs documents
+    top_k_retrieval: int
+    max_context_length: int
 
     # LLM Settings
-    PRIMARY_MODEL = os.getenv("PRIMARY_MODEL", "claude-sonnet-4-20250514")
-    FALLBACK_MODELS = ["gpt-4", "gemini-pro"]
-    MAX_TOKENS = int(os.getenv("MAX_TOKENS", "1000"))
-    TEMPERATURE = float(os.getenv("TEMPERATURE", "0.1"))
+    primary_model: str
+    max_tokens: int
+    temperature: float
 
     # Web Scraping Settings
-    WEB_SCRAPING_ENABLED = os.getenv("WEB_SCRAPING_ENABLED", "true").lower() == "true"
-    MAX_PAGES_PER_SITE = int(os.getenv("MAX_PAGES_PER_SITE", "50"))
-    SCRAPING_DELAY = float(os.getenv("SCRAPING_DELAY", "1.0"))
-    USER_AGENT = os.getenv("USER_AGENT", "TeamcenterAgent/1.0 (Educational)")
-
-    # Content Filtering
-    MIN_CONTENT_LENGTH = 100
-    MAX_CONTENT_LENGTH = 5000
-    RELEVANCE_THRESHOLD = 0.7
+    web_scraping_enabled: bool
+    max_pages_per_site: int
+    scraping_delay: float
+    user_agent: str
 
     # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-
-    # File Paths
-    CONVERSATIONS_FILE = DATA_DIR / "conversations.json"
-    PROCESSED_DOCS_FILE = DATA_DIR / "processed_docs.json"
-    CONTENT_METADATA_FILE = DATA_DIR / "content_metadata.json"
-    FAISS_INDEX_PATH = DATA_DIR / "vectors"
-    WEB_CONTENT_PATH = DATA_DIR / "web_content"
+    log_level: str
+
+    # Environment
+    app_env: str
+    validate_config: bool
+
+    # File Paths (msgpack for internal caches, JSON for user-facing files)
+    conversations_file: Path
+    processed_docs_file: Path
+    content_metadata_file: Path
+    faiss_index_path: Path
+    web_content_path: Path
+
+    # String forms of the data paths, for open()/np.save/faiss.write_index
+    data_dir_str: str
+    conversations_file_str: str
+    processed_docs_file_str: str
+    content_metadata_file_str: str
+    faiss_index_path_str: str
+    web_content_path_str: str
 
     # Web Sources Configuration Files
-    URLS_FILE = WEB_SOURCES_DIR / "urls.txt"
-    FORUMS_CONFIG_FILE = WEB_SOURCES_DIR / "forums_config.yaml"
-    SITEMAP_URLS_FILE = WEB_SOURCES_DIR / "sitemap_urls.txt"
-    CONTENT_SOURCES_FILE = WEB_SOURCES_DIR / "content_sources.md"
+    urls_file: Path
+    forums_config_file: Path
+    sitemap_urls_file: Path
+    content_sources_file: Path
 
     # Test Files
-    TEST_QUESTIONS_FILE = TESTS_DIR / "test_questions.txt"
-    TEST_DOCUMENTS_DIR = TESTS_DIR / "test_documents"
+    test_questions_file: Path
+    test_documents_dir: Path
+
+
+def _as_bool(value) -> bool:
+    return value if isinstance(value, bool) else value.lower() == "true"
+
+
+def _as_bool_flag(value) -> bool:
+    return value if isinstance(value, bool) else value == "1"
+
+
+def _as_is(value):
+    return value
+
+
+# Environment variables read by get_settings(): (name, caster, default).
+# Each becomes the Settings field of the same name in lower case, except the
+# *_DIRECTORY entries, which are resolved into Path fields.
+_SCHEMA = [
+    # Project Paths
+    ("DATA_DIRECTORY", str, "data"),
+    ("DOCUMENTS_DIRECTORY", str, "documents"),
+    ("WEB_SOURCES_DIRECTORY", str, "web_sources"),
+    # API Keys
+    ("ANTHROPIC_API_KEY", _as_is, None),
+    ("LANGFUSE_PUBLIC_KEY", _as_is, None),
+    ("LANGFUSE_SECRET_KEY", _as_is, None),
+    ("LANGFUSE_HOST", str, "https://cloud.langfuse.com"),
+    ("OPENAI_API_KEY", _as_is, None),
+    ("GOOGLE_API_KEY", _as_is, None),
+    # Vector Store Settings
+    ("EMBEDDING_MODEL", str, "all-MiniLM-L6-v2"),
+    # faiss.index_factory string: "Flat" is exact search, "IVF1024,PQ48"
+    # trades recall for sublinear search once the corpus reaches ~50k chunks
+    ("FAISS_INDEX_TYPE", str, "Flat"),
+    ("FAISS_NPROBE", int, 16),
+    ("CHUNK_SIZE", int, 800),
+    ("CHUNK_OVERLAP", int, 100),
+    # RAG Pipeline Settings
+    ("TOP_K_RETRIEVAL", int, 5),
+    ("MAX_CONTEXT_LENGTH", int, 4000),
+    # LLM Settings
+    ("PRIMARY_MODEL", str, "claude-sonnet-4-20250514"),
+    ("MAX_TOKENS", int, 1000),
+    ("TEMPERATURE", float, 0.1),
+    # Web Scraping Settings
+    ("WEB_SCRAPING_ENABLED", _as_bool, True),
+    ("MAX_PAGES_PER_SITE", int, 50),
+    ("SCRAPING_DELAY", float, 1.0),
+    ("USER_AGENT", str, "TeamcenterAgent/1.0 (Educational)"),
+    # Logging
+    ("LOG_LEVEL", str, "INFO"),
+    # Environment (see check_config)
+    ("APP_ENV", str, "prod"),
+    ("VALIDATE_CONFIG", _as_bool_flag, False),
+]
+
+
+def _parse_env(name: str, caster, default):
+    raw = os.environ.get(name, default)
+    try:
+        return caster(raw)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: {raw!r}") from None
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load the .env file and parse environment settings on first call only"""
+    if not os.environ.get("DOTENV_LOADED"):
+        from dotenv import load_dotenv
+        load_dotenv()
+
+    cfg: Dict[str, Any] = {name.lower(): _parse_env(name, caster, default)
+                          for name, caster, default in _SCHEMA}
+
+    project_root = Path(__file__).parent
+    data_dir = project_root / cfg.pop("data_directory")
+    documents_dir = project_root / cfg.pop("documents_directory")
+    web_sources_dir = project_root / cfg.pop("web_sources_directory")
+    tests_dir = project_root / "tests"
+    data_paths: Dict[str, Any] = {
+        "conversations_file": data_dir / "conversations.msgpack",
+        "processed_docs_file": data_dir / "processed_docs.msgpack",
+        "content_metadata_file": data_dir / "content_metadata.json",
+        "faiss_index_path": data_dir / "vectors",
+        "web_content_path": data_dir / "web_content",
+    }
+    data_paths.update({f"{name}_str": str(path) for name, path in data_paths.items()})
+
+    return Settings(
+        project_root=project_root,
+        data_dir=data_dir,
+        documents_dir=documents_dir,
+        web_sources_dir=web_sources_dir,
+        experiments_dir=project_root / "experiments",
+        tests_dir=tests_dir,
+        data_dir_str=str(data_dir),
+        **data_paths,
+        urls_file=web_sources_dir / "urls.txt",
+        forums_config_file=web_sources_dir / "forums_config.yaml",
+        sitemap_urls_file=web_sources_dir / "sitemap_urls.txt",
+        content_sources_file=web_sources_dir / "content_sources.md",
+        test_questions_file=tests_dir / "test_questions.txt",
+        test_documents_dir=tests_dir / "test_documents",
+        **cfg,
+    )
+
+
+class _LazySettings(type):
+    """Metaclass resolving upper-case Config attributes from get_settings()"""
+
+    def __getattr__(cls, name):
+        if name.isupper() and name.lower() in Settings.__slots__:
+            return getattr(get_settings(), name.lower())
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+
+class Config(metaclass=_LazySettings):
+    """Configuration class for the Teamcenter Easy Plan AI Agent
+
+    Static defaults live on the class. Environment-derived settings
+    (paths, API keys, numeric tuning) are read through get_settings() on
+    first access, so importing this module does no I/O.
+    """
+
+    # RAG Pipeline Settings
+    CONVERSATION_MEMORY_LIMIT = 10
+    WEB_CONTENT_WEIGHT = 0.7  # Relative weight of web content vs documents
+
+    # LLM Settings
+    FALLBACK_MODELS = ["gpt-4", "gemini-pro"]
+
+    # Content Filtering
+    MIN_CONTENT_LENGTH = 100
+    MAX_CONTENT_LENGTH = 5000
+    RELEVANCE_THRESHOLD = 0.7
 
     # Default Web Sources
     FORUM_URLS = [
@@ -101,6 +229,20 @@ class Config:
         # Add more documentation sites as needed
     ]
 
+    @classmethod
+    def ensure_dirs(cls):
+        """Create the data directories on first use instead of at import time"""
+        for path in (
+            cls.DATA_DIR,
+            cls.DOCUMENTS_DIR,
+            cls.WEB_SOURCES_DIR,
+            cls.FAISS_INDEX_PATH,
+            cls.WEB_CONTENT_PATH / "forums",
+            cls.WEB_CONTENT_PATH / "documentation",
+            cls.WEB_CONTENT_PATH / "tutorials",
+        ):
+            path.mkdir(parents=True, exist_ok=True)
+
     @classmethod
     def validate_config(cls) -> List[str]:
         """Validate required configuration and return list of errors"""
@@ -190,10 +332,42 @@ class Config:
         print("=" * 50)
 
 
-# Validate configuration on import
-config_errors = Config.validate_config()
-if config_errors:
-    print("⚠️  Configuration Errors:")
-    for error in config_errors:
-        print(f"   - {error}")
-    print("Please check your .env file and fix these issues.")
\ No newline at end of file
+# Environments in which check_config() validates without being asked to
+VALIDATING_ENVIRONMENTS = ("dev", "test")
+
+
+def validation_enabled() -> bool:
+    """Return whether configuration validation should run in this environment"""
+    settings = get_settings()
+    return settings.app_env in VALIDATING_ENVIRONMENTS or settings.validate_config
+
+
+def check_config(force: bool = False) -> bool:
+    """Print configuration errors, if any, and return whether config is valid
+
+    Outside dev/test (APP_ENV) validation runs in a loose, silent mode: the
+    rules are not evaluated, nothing is printed and True is returned.
+    Set VALIDATE_CONFIG=1 or pass force=True to validate anyway.
+    """
+    if not (force or validation_enabled()):
+        return True
+
+    config_errors = Config.validate_config()
+    if config_errors:
+        print("⚠️  Configuration Errors:")
+        for error in config_errors:
+            print(f"   - {error}")
+        print("Please check your .env file and fix these issues.")
+    return not config_errors
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show the agent configuration")
+    parser.add_argument("--validate", action="store_true",
+                        help="validate the configuration regardless of APP_ENV")
+    args = parser.parse_args()
+
+    Config.print_config_summary()
+    raise SystemExit(0 if check_config(force=args.validate) else 1)
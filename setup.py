@@ -0,0 +1,16 @@
+"""
+Build script compiling the data models with mypyc.
+
+``python setup.py build_ext --inplace`` places a compiled ``src/models``
+extension next to ``src/models.py``; Python imports it in preference to the
+source, which stays importable as plain Python when nothing is built.
+"""
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="teamcenter-easy-plan-agent",
+    packages=["src"],
+    py_modules=["config"],
+    ext_modules=mypycify(["src/models.py"]),
+)
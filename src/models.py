@@ -5,34 +5,175 @@ This module defines the fundamental data structures used throughout the system
 for document processing, conversation management, search results, and web sources.
 """
 
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import MISSING, dataclass, field, fields
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from pathlib import Path
-import json
-from enum import Enum
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
+from itertools import chain
+from array import array
+import base64
+import math
+import ijson  # type: ignore[import-untyped]
+import msgpack  # type: ignore[import-untyped]
+import orjson
+from enum import Enum, IntEnum
+
+
+class DocumentType(IntEnum):
+    """Enumeration of supported document types.
+
+    Values are ints for compact serialization; note that members therefore
+    compare equal to ints and to ContentSource members with the same value.
+    Use ``.name`` when showing a type to users.
+    """
+    # Keep "DocumentType.PDF" rather than "1" from str() and f-strings
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+
+    PDF = 1
+    DOCX = 2
+    MD = 3
+    TXT = 4
+    WEB = 5
+    UNKNOWN = 6
+
+
+class ContentSource(IntEnum):
+    """Enumeration of content sources (int-valued, see DocumentType)."""
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+
+    LOCAL_DOCUMENT = 1
+    WEB_SCRAPE = 2
+    FORUM_POST = 3
+    DOCUMENTATION = 4
+    MANUAL = 5
+
+
+# Serialized value to enum member; a dict lookup instead of Enum.__call__.
+# The string values written before the enums became IntEnum still resolve.
+_DOC_TYPE_BY_VALUE: Dict[Union[int, str], DocumentType] = {
+    **{m.value: m for m in DocumentType},
+    'pdf': DocumentType.PDF,
+    'docx': DocumentType.DOCX,
+    'markdown': DocumentType.MD,
+    'text': DocumentType.TXT,
+    'web': DocumentType.WEB,
+    'unknown': DocumentType.UNKNOWN,
+}
+_CONTENT_SOURCE_BY_VALUE: Dict[Union[int, str], ContentSource] = {
+    **{m.value: m for m in ContentSource},
+    **{m.name.lower(): m for m in ContentSource},
+}
+
+# Default context window of ConversationSession.get_recent_messages(): a
+# question and an answer for each of the 10 exchanges the agent remembers
+# (Config.CONVERSATION_MEMORY_LIMIT); callers holding Config pass their own.
+RECENT_MESSAGES_LIMIT = 20
+
+# File extension to document type, used by DocumentChunk auto-detection
+_SUFFIX_TO_TYPE: Dict[str, DocumentType] = {
+    '.pdf': DocumentType.PDF,
+    '.docx': DocumentType.DOCX,
+    '.md': DocumentType.MD,
+    '.txt': DocumentType.TXT,
+    '.html': DocumentType.WEB,
+    '.htm': DocumentType.WEB,
+}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO timestamp, memoised because batch dumps repeat them.
+
+    Safe to share: datetime instances are immutable.
+    """
+    return datetime.fromisoformat(value)
+
+
+def quantize_embedding(embedding: Sequence[float]) -> Tuple[bytes, float]:
+    """Scalar-quantize an embedding to int8 codes with a single scale factor.
+
+    This is the one quantization scheme in the project: serialized chunks use
+    it and ChunkStore.extend() applies the same formula to a whole batch, so
+    their codes are identical.
+    """
+    peak = float(max(map(abs, embedding), default=0.0))
+    scale = peak / 127 if peak else 1.0
+    return array('b', [round(v / scale) for v in embedding]).tobytes(), scale
+
+
+def dequantize_embedding(codes: bytes, scale: float) -> List[float]:
+    """Reconstruct an approximate embedding from int8 codes and its scale."""
+    return [code * scale for code in array('b', codes)]
 
 
-class DocumentType(Enum):
-    """Enumeration of supported document types."""
-    PDF = "pdf"
-    DOCX = "docx"
-    MD = "markdown"
-    TXT = "text"
-    WEB = "web"
-    UNKNOWN = "unknown"
+def _encode_embedding(embedding: Optional[List[float]],
+                      raw_bytes: bool = False) -> Optional[Dict[str, Any]]:
+    """Serialize an embedding as int8 codes plus scale.
+
+    The codes are base64 text so the result is JSON-safe; ``raw_bytes``
+    keeps them as bytes for binary formats such as msgpack.
+    """
+    if embedding is None:
+        return None
+    codes, scale = quantize_embedding(embedding)
+    return {'codes': codes if raw_bytes else base64.b64encode(codes).decode('ascii'),
+            'scale': scale}
 
 
-class ContentSource(Enum):
-    """Enumeration of content sources."""
-    LOCAL_DOCUMENT = "local_document"
-    WEB_SCRAPE = "web_scrape"
-    FORUM_POST = "forum_post"
-    DOCUMENTATION = "documentation"
-    MANUAL = "manual"
+def _decode_embedding(data: Any) -> Optional[List[float]]:
+    """Inverse of _encode_embedding; plain float lists are passed through."""
+    if isinstance(data, dict):
+        codes = data['codes']
+        if isinstance(codes, str):
+            codes = base64.b64decode(codes)
+        return dequantize_embedding(codes, data['scale'])
+    return data
 
 
-@dataclass
+def _compile_from_dict(cls: type, decoders: Dict[str, str]) -> Callable[..., Any]:
+    """
+    Generate a ``from_dict(cls, data, now=None)`` function specialised for a
+    dataclass, to be called from the class's own ``from_dict`` classmethod.
+
+    Every init field becomes one positional constructor argument:
+    ``data['name']`` when the field is required, otherwise
+    ``data['name'] if 'name' in data else <field default>``; fields whose
+    default is ``datetime.now`` fall back to the caller's ``now`` so a batch
+    shares one timestamp instead of one clock read per record. ``decoders`` maps
+    a field name to an expression template (``{}`` is the stored value) that
+    converts the serialized form back. The source is compiled once at import,
+    so bulk loading skips the per-record ``dict.get`` and keyword-argument
+    dispatch of a hand-written ``from_dict``.
+    """
+    namespace: Dict[str, Any] = dict(globals())
+    args = []
+    for f in fields(cls):
+        if not f.init:
+            continue
+        key = repr(f.name)
+        value = decoders.get(f.name, '{}').format(f"data[{key}]")
+        if f.default is not MISSING:
+            namespace[f'_default_{f.name}'] = f.default
+            value = f"({value} if {key} in data else _default_{f.name})"
+        elif f.default_factory == datetime.now:
+            value = f"({value} if {key} in data else (now or datetime.now()))"
+        elif f.default_factory is not MISSING:
+            namespace[f'_factory_{f.name}'] = f.default_factory
+            value = f"({value} if {key} in data else _factory_{f.name}())"
+        args.append(value)
+
+    source = "def from_dict(cls, data, now=None):\n    return cls({})\n".format(",\n               ".join(args))
+    exec(compile(source, f"<{cls.__name__}.from_dict>", "exec"), namespace)
+    from_dict = namespace['from_dict']
+    from_dict.__qualname__ = f"{cls.__name__}.from_dict"
+    from_dict.__doc__ = "Create instance from dictionary."
+    return from_dict
+
+
+@dataclass(slots=True)
 class DocumentChunk:
     """
     Represents a chunk of processed document content with metadata.
@@ -63,19 +204,9 @@ class DocumentChunk:
 
     def _detect_document_type(self):
         """Auto-detect document type from file extension."""
-        try:
-            suffix = Path(self.source_file).suffix.lower()
-            type_mapping = {
-                '.pdf': DocumentType.PDF,
-                '.docx': DocumentType.DOCX,
-                '.md': DocumentType.MD,
-                '.txt': DocumentType.TXT,
-                '.html': DocumentType.WEB,
-                '.htm': DocumentType.WEB,
-            }
-            self.document_type = type_mapping.get(suffix, DocumentType.UNKNOWN)
-        except Exception:
-            self.document_type = DocumentType.UNKNOWN
+        source_file = self.source_file
+        suffix = source_file[source_file.rfind('.'):].lower()
+        self.document_type = _SUFFIX_TO_TYPE.get(suffix, DocumentType.UNKNOWN)
 
     @property
     def length(self) -> int:
@@ -87,46 +218,47 @@ class DocumentChunk:
         """Return approximate word count."""
         return len(self.content.split())
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+    def to_dict(self, include_derived: bool = False,
+                raw_bytes: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Derived properties are omitted unless ``include_derived`` is set;
+        from_dict() does not read them. The embedding codes are base64 text
+        unless ``raw_bytes`` is set, which binary writers use.
+        """
+        data: Dict[str, Any] = {
             'content': self.content,
             'source_file': self.source_file,
             'chunk_id': self.chunk_id,
             'start_char': self.start_char,
             'end_char': self.end_char,
             'metadata': self.metadata,
-            'embedding': self.embedding,
+            'embedding': _encode_embedding(self.embedding, raw_bytes),
             'document_type': self.document_type.value,
             'content_source': self.content_source.value,
-            'created_at': self.created_at.isoformat(),
-            'length': self.length,
-            'word_count': self.word_count
+            'created_at': self.created_at.isoformat()
         }
+        if include_derived:
+            data['length'] = self.length
+            data['word_count'] = self.word_count
+        return data
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'DocumentChunk':
-        """Create instance from dictionary."""
-        # Convert enum strings back to enums
-        doc_type = DocumentType(data.get('document_type', DocumentType.UNKNOWN.value))
-        content_src = ContentSource(data.get('content_source', ContentSource.LOCAL_DOCUMENT.value))
-        created_at = datetime.fromisoformat(data.get('created_at', datetime.now().isoformat()))
+    def from_dict(cls, data: Dict[str, Any], now: Optional[datetime] = None) -> 'DocumentChunk':
+        """Create instance from dictionary; ``now`` backfills a missing created_at."""
+        return _document_chunk_from_dict(cls, data, now)
 
-        return cls(
-            content=data['content'],
-            source_file=data['source_file'],
-            chunk_id=data['chunk_id'],
-            start_char=data.get('start_char', 0),
-            end_char=data.get('end_char', 0),
-            metadata=data.get('metadata', {}),
-            embedding=data.get('embedding'),
-            document_type=doc_type,
-            content_source=content_src,
-            created_at=created_at
-        )
 
+# Generated once at import; DocumentChunk.from_dict delegates to it
+_document_chunk_from_dict = _compile_from_dict(DocumentChunk, {
+    'embedding': '_decode_embedding({})',
+    'document_type': '_DOC_TYPE_BY_VALUE.get({}, DocumentType.UNKNOWN)',
+    'content_source': '_CONTENT_SOURCE_BY_VALUE.get({}, ContentSource.LOCAL_DOCUMENT)',
+    'created_at': '_parse_iso({})',
+})
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationMessage:
     """
     Represents a single message in a conversation between user and AI.
@@ -169,9 +301,9 @@ class ConversationMessage:
         }
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ConversationMessage':
-        """Create instance from dictionary."""
-        timestamp = datetime.fromisoformat(data.get('timestamp', datetime.now().isoformat()))
+    def from_dict(cls, data: Dict[str, Any], now: Optional[datetime] = None) -> 'ConversationMessage':
+        """Create instance from dictionary; ``now`` backfills a missing timestamp."""
+        timestamp = _parse_iso(data['timestamp']) if 'timestamp' in data else (now or datetime.now())
 
         return cls(
             role=data['role'],
@@ -184,7 +316,7 @@ class ConversationMessage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """
     Represents a search result with relevance scoring and source information.
@@ -220,9 +352,15 @@ class SearchResult:
         else:
             return "Very Low"
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+    def to_dict(self, include_derived: bool = False,
+                raw_bytes: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Derived properties are omitted unless ``include_derived`` is set;
+        from_dict() does not read them. The embedding codes are base64 text
+        unless ``raw_bytes`` is set, which binary writers use.
+        """
+        data: Dict[str, Any] = {
             'content': self.content,
             'source': self.source,
             'score': self.score,
@@ -230,17 +368,19 @@ class SearchResult:
             'metadata': self.metadata,
             'document_type': self.document_type.value,
             'content_source': self.content_source.value,
-            'timestamp': self.timestamp.isoformat(),
-            'relevance_level': self.relevance_level,
-            'is_relevant': self.is_relevant
+            'timestamp': self.timestamp.isoformat()
         }
+        if include_derived:
+            data['relevance_level'] = self.relevance_level
+            data['is_relevant'] = self.is_relevant
+        return data
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'SearchResult':
-        """Create instance from dictionary."""
-        doc_type = DocumentType(data.get('document_type', DocumentType.UNKNOWN.value))
-        content_src = ContentSource(data.get('content_source', ContentSource.LOCAL_DOCUMENT.value))
-        timestamp = datetime.fromisoformat(data.get('timestamp', datetime.now().isoformat()))
+    def from_dict(cls, data: Dict[str, Any], now: Optional[datetime] = None) -> 'SearchResult':
+        """Create instance from dictionary; ``now`` backfills a missing timestamp."""
+        doc_type = _DOC_TYPE_BY_VALUE.get(data.get('document_type', ''), DocumentType.UNKNOWN)
+        content_src = _CONTENT_SOURCE_BY_VALUE.get(data.get('content_source', ''), ContentSource.LOCAL_DOCUMENT)
+        timestamp = _parse_iso(data['timestamp']) if 'timestamp' in data else (now or datetime.now())
 
         return cls(
             content=data['content'],
@@ -254,7 +394,16 @@ class SearchResult:
         )
 
 
-@dataclass
+# Days after which a WebSource is stale, by scrape_frequency
+_FREQUENCY_DAYS: Dict[str, float] = {
+    "daily": 1,
+    "weekly": 7,
+    "monthly": 30,
+    "manual": math.inf,  # Never stale for manual
+}
+
+
+@dataclass(slots=True)
 class WebSource:
     """
     Represents a web source with scraping metadata and content quality metrics.
@@ -277,21 +426,15 @@ class WebSource:
     @property
     def is_stale(self) -> bool:
         """Check if content needs re-scraping based on frequency."""
+        return self.is_stale_at(datetime.now())
+
+    def is_stale_at(self, now: datetime) -> bool:
+        """Check staleness against a caller-supplied clock, for batch checks."""
         if not self.last_scraped:
             return True
 
-        now = datetime.now()
-        time_diff = now - self.last_scraped
-
-        frequency_days = {
-            "daily": 1,
-            "weekly": 7,
-            "monthly": 30,
-            "manual": float('inf')  # Never stale for manual
-        }
-
-        threshold_days = frequency_days.get(self.scrape_frequency, 30)
-        return time_diff.days >= threshold_days
+        threshold_days = _FREQUENCY_DAYS.get(self.scrape_frequency, 30)
+        return (now - self.last_scraped).days >= threshold_days
 
     @property
     def is_high_quality(self) -> bool:
@@ -324,9 +467,15 @@ class WebSource:
         self.error_message = error_message
         self.last_scraped = datetime.now()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+    def to_dict(self, include_derived: bool = False,
+                now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Derived properties are omitted unless ``include_derived`` is set;
+        from_dict() does not read them. ``now`` is the clock used for
+        ``is_stale``, so a batch can share one.
+        """
+        data: Dict[str, Any] = {
             'url': self.url,
             'title': self.title,
             'content': self.content,
@@ -337,18 +486,20 @@ class WebSource:
             'quality_score': self.quality_score,
             'metadata': self.metadata,
             'error_message': self.error_message,
-            'chunk_count': self.chunk_count,
-            'is_stale': self.is_stale,
-            'is_high_quality': self.is_high_quality,
-            'status_emoji': self.status_emoji
+            'chunk_count': self.chunk_count
         }
+        if include_derived:
+            data['is_stale'] = self.is_stale_at(now or datetime.now())
+            data['is_high_quality'] = self.is_high_quality
+            data['status_emoji'] = self.status_emoji
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'WebSource':
         """Create instance from dictionary."""
         last_scraped = None
         if data.get('last_scraped'):
-            last_scraped = datetime.fromisoformat(data['last_scraped'])
+            last_scraped = _parse_iso(data['last_scraped'])
 
         return cls(
             url=data['url'],
@@ -365,12 +516,15 @@ class WebSource:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
     """
     Represents a conversation session with multiple messages.
 
     Used for grouping related messages and managing conversation context.
+    The full history is kept for persistence; only the context window
+    returned by get_recent_messages() is bounded, by default to the last
+    RECENT_MESSAGES_LIMIT messages.
     """
     session_id: str
     messages: List[ConversationMessage] = field(default_factory=list)
@@ -383,9 +537,14 @@ class ConversationSession:
         self.messages.append(message)
         self.last_activity = datetime.now()
 
-    def get_recent_messages(self, count: int = 10) -> List[ConversationMessage]:
-        """Get the most recent messages (for context window)."""
-        return self.messages[-count:] if len(self.messages) > count else self.messages
+    def get_recent_messages(self, count: Optional[int] = None) -> List[ConversationMessage]:
+        """Get the most recent messages (for context window).
+
+        ``count`` defaults to RECENT_MESSAGES_LIMIT.
+        """
+        if count is None:
+            count = RECENT_MESSAGES_LIMIT
+        return self.messages[-count:] if count > 0 else []
 
     @property
     def message_count(self) -> int:
@@ -397,24 +556,31 @@ class ConversationSession:
         """Return total token count for all messages."""
         return sum(msg.token_count or 0 for msg in self.messages)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for serialization."""
-        return {
+    def to_dict(self, include_derived: bool = False) -> Dict[str, Any]:
+        """Convert to dictionary for serialization.
+
+        Derived properties are omitted unless ``include_derived`` is set;
+        from_dict() does not read them.
+        """
+        data: Dict[str, Any] = {
             'session_id': self.session_id,
             'messages': [msg.to_dict() for msg in self.messages],
             'created_at': self.created_at.isoformat(),
             'last_activity': self.last_activity.isoformat(),
-            'metadata': self.metadata,
-            'message_count': self.message_count,
-            'total_tokens': self.total_tokens
+            'metadata': self.metadata
         }
+        if include_derived:
+            data['message_count'] = self.message_count
+            data['total_tokens'] = self.total_tokens
+        return data
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'ConversationSession':
-        """Create instance from dictionary."""
-        messages = [ConversationMessage.from_dict(msg) for msg in data.get('messages', [])]
-        created_at = datetime.fromisoformat(data.get('created_at', datetime.now().isoformat()))
-        last_activity = datetime.fromisoformat(data.get('last_activity', datetime.now().isoformat()))
+    def from_dict(cls, data: Dict[str, Any], now: Optional[datetime] = None) -> 'ConversationSession':
+        """Create instance from dictionary; ``now`` backfills missing timestamps."""
+        now = now or datetime.now()
+        messages = [ConversationMessage.from_dict(msg, now) for msg in data.get('messages', [])]
+        created_at = _parse_iso(data['created_at']) if 'created_at' in data else now
+        last_activity = _parse_iso(data['last_activity']) if 'last_activity' in data else now
 
         return cls(
             session_id=data['session_id'],
@@ -429,27 +595,100 @@ class ConversationSession:
 def save_models_to_json(models: List[Union[DocumentChunk, ConversationMessage, SearchResult, WebSource]],
                        file_path: str):
     """Save a list of model instances to JSON file."""
-    data = [model.to_dict() for model in models]
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    data = orjson.dumps([model.to_dict() for model in models],
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
+def _read_json(file_path: str) -> Any:
+    """Parse a JSON file with orjson."""
+    with open(file_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def iter_document_chunks(file_path: str) -> Iterator[DocumentChunk]:
+    """Stream DocumentChunk instances from a JSON file one record at a time.
+
+    Only the current record is held in memory, so large chunk dumps can be
+    fed into an index without materializing the whole list.
+    """
+    now = datetime.now()
+    with open(file_path, 'rb') as f:
+        for item in ijson.items(f, 'item', use_float=True):
+            yield DocumentChunk.from_dict(item, now)
 
 
-def load_document_chunks_from_json(file_path: str) -> List[DocumentChunk]:
-    """Load DocumentChunk instances from JSON file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return [DocumentChunk.from_dict(item) for item in data]
+def _document_chunks_from_dicts(items: List[Dict[str, Any]], now: datetime) -> List[DocumentChunk]:
+    """Build DocumentChunks for one shard; runs in a worker process."""
+    return [DocumentChunk.from_dict(item, now) for item in items]
+
+
+def load_document_chunks_from_json(file_path: str, workers: Optional[int] = None) -> List[DocumentChunk]:
+    """Load DocumentChunk instances from JSON file.
+
+    By default records are streamed one at a time. With ``workers`` > 1 the
+    file is parsed whole and contiguous shards are converted in a process
+    pool, which pays off for large dumps where from_dict dominates; the
+    chunk order is preserved either way.
+    """
+    if not workers or workers < 2:
+        return list(iter_document_chunks(file_path))
+
+    items = _read_json(file_path)
+    if not items:
+        return []
+    shard_size = -(-len(items) // workers)
+    shards = [items[i:i + shard_size] for i in range(0, len(items), shard_size)]
+    convert = partial(_document_chunks_from_dicts, now=datetime.now())
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(chain.from_iterable(executor.map(convert, shards)))
 
 
 def load_web_sources_from_json(file_path: str) -> List[WebSource]:
     """Load WebSource instances from JSON file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return [WebSource.from_dict(item) for item in data]
+    return [WebSource.from_dict(item) for item in _read_json(file_path)]
+
+
+def get_stale_web_sources(sources: List[WebSource]) -> List[WebSource]:
+    """Return the sources due for re-scraping, reading the clock once."""
+    now = datetime.now()
+    return [source for source in sources if source.is_stale_at(now)]
 
 
 def load_conversation_session_from_json(file_path: str) -> ConversationSession:
     """Load ConversationSession from JSON file."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    return ConversationSession.from_dict(data)
\ No newline at end of file
+    return ConversationSession.from_dict(_read_json(file_path))
+
+
+def save_models_binary(models: List[Union[DocumentChunk, ConversationMessage, SearchResult,
+                                          WebSource, ConversationSession]],
+                       file_path: str):
+    """Save a list of model instances to a msgpack file.
+
+    For internal caches (conversations, processed chunks) that are never read
+    by people: smaller and faster than JSON, and embedding codes are stored
+    as raw bytes rather than base64.
+    """
+    data = msgpack.packb([model.to_dict(raw_bytes=True) if isinstance(model, DocumentChunk)
+                          else model.to_dict() for model in models], use_bin_type=True)
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
+def _read_binary(file_path: str) -> Any:
+    """Parse a msgpack file written by save_models_binary()."""
+    with open(file_path, 'rb') as f:
+        return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+
+
+def load_document_chunks_from_binary(file_path: str) -> List[DocumentChunk]:
+    """Load DocumentChunk instances from msgpack file."""
+    now = datetime.now()
+    return [DocumentChunk.from_dict(item, now) for item in _read_binary(file_path)]
+
+
+def load_conversation_sessions_from_binary(file_path: str) -> List[ConversationSession]:
+    """Load ConversationSession instances from msgpack file."""
+    now = datetime.now()
+    return [ConversationSession.from_dict(item, now) for item in _read_binary(file_path)]
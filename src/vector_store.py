@@ -0,0 +1,241 @@
+"""
+Vector storage for the Teamcenter Easy Plan AI Agent.
+
+Chunk embeddings are kept as one contiguous matrix with parallel per-row
+metadata lists (structure of arrays) rather than a Python list of floats on
+every DocumentChunk. Rows are scalar-quantized to int8 with one float32 scale
+per row (the models.quantize_embedding scheme), a quarter of the float32 footprint,
+and a similarity query is a blocked matrix-vector product instead of a
+gather over thousands of lists.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import faiss
+import numpy as np
+
+from config import Config
+from .models import (
+    ContentSource,
+    DocumentChunk,
+    DocumentType,
+    SearchResult,
+    _CONTENT_SOURCE_BY_VALUE,
+    _DOC_TYPE_BY_VALUE,
+)
+
+
+def build_faiss_index(embeddings: np.ndarray, index_type: Optional[str] = None,
+                      nprobe: Optional[int] = None) -> faiss.Index:
+    """
+    Build and populate a FAISS index from an (N, D) embedding matrix.
+
+    ``index_type`` is a ``faiss.index_factory`` string and defaults to
+    Config.FAISS_INDEX_TYPE. The index uses the inner-product metric so it
+    ranks like ChunkStore.search(). Indices that need training, such as
+    ``"IVF1024,PQ48"``, are trained on the embeddings being added, which
+    must then number at least ~39 per IVF list. ``nprobe`` (default
+    Config.FAISS_NPROBE) sets how many IVF lists a query visits.
+    """
+    spec = index_type or Config.FAISS_INDEX_TYPE
+    embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+
+    index = faiss.index_factory(embeddings.shape[1], spec, faiss.METRIC_INNER_PRODUCT)
+    if not index.is_trained:
+        index.train(embeddings)
+    index.add(embeddings)
+
+    try:
+        faiss.extract_index_ivf(index).nprobe = nprobe or Config.FAISS_NPROBE
+    except RuntimeError:
+        pass  # Not an IVF index, nothing to tune
+    return index
+
+
+class ChunkStore:
+    """
+    Column-oriented store of embedded document chunks.
+
+    Row ``i`` of ``codes``/``scales`` belongs to ``chunk_ids[i]``,
+    ``contents[i]`` and so on; the embedding it approximates is
+    ``codes[i] * scales[i]``. The arrays are over-allocated and doubled when
+    full, so adding chunks one at a time stays amortised O(1).
+    """
+
+    INITIAL_CAPACITY = 1024
+    # Rows scored per block in search(); keeps the float32 temporary in cache
+    SEARCH_BLOCK_ROWS = 256
+
+    def __init__(self, name: str = "documents", dimension: int = 384):
+        self.name = name
+        self.dimension = dimension
+        self._size = 0
+        self._codes = np.empty((self.INITIAL_CAPACITY, dimension), dtype=np.int8)
+        self._scales = np.empty(self.INITIAL_CAPACITY, dtype=np.float32)
+        self.chunk_ids: List[str] = []
+        self.contents: List[str] = []
+        self.sources: List[str] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.document_types: List[DocumentType] = []
+        self.content_sources: List[ContentSource] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def codes(self) -> np.ndarray:
+        """Return the (N, D) int8 quantized embeddings of stored chunks."""
+        return self._codes[:self._size]
+
+    @property
+    def scales(self) -> np.ndarray:
+        """Return the (N,) float32 per-row quantization scales."""
+        return self._scales[:self._size]
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """Return the dequantized (N, D) float32 embedding matrix."""
+        return self.codes * self.scales[:, None]
+
+    def _reserve(self, count: int):
+        """Grow the code and scale arrays so ``count`` more rows fit."""
+        required = self._size + count
+        capacity = len(self._codes)
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        codes = np.empty((capacity, self.dimension), dtype=np.int8)
+        codes[:self._size] = self.codes
+        scales = np.empty(capacity, dtype=np.float32)
+        scales[:self._size] = self.scales
+        self._codes, self._scales = codes, scales
+
+    def add(self, chunk: DocumentChunk):
+        """Append an embedded chunk to the store."""
+        self.extend([chunk])
+
+    def extend(self, chunks: Sequence[DocumentChunk]):
+        """Append several embedded chunks, growing the matrix at most once.
+
+        The batch is quantized in one vectorized pass with the
+        models.quantize_embedding formula (scale = max|v| / 127, codes
+        rounded half to even), so rows match serialized chunks exactly.
+        """
+        for chunk in chunks:
+            if chunk.embedding is None:
+                raise ValueError(f"Chunk {chunk.chunk_id} has no embedding")
+            if len(chunk.embedding) != self.dimension:
+                raise ValueError(
+                    f"Chunk {chunk.chunk_id} has dimension {len(chunk.embedding)}, "
+                    f"expected {self.dimension}"
+                )
+        if not chunks:
+            return
+
+        matrix = np.array([chunk.embedding for chunk in chunks], dtype=np.float64)
+        peaks = np.abs(matrix).max(axis=1)
+        scales = np.where(peaks > 0, peaks / 127, 1.0)
+        start, stop = self._size, self._size + len(chunks)
+        self._reserve(len(chunks))
+        self._codes[start:stop] = np.rint(matrix / scales[:, None])
+        self._scales[start:stop] = scales
+        self._size = stop
+        for chunk in chunks:
+            self.chunk_ids.append(chunk.chunk_id)
+            self.contents.append(chunk.content)
+            self.sources.append(chunk.source_file)
+            self.metadata.append(chunk.metadata)
+            self.document_types.append(chunk.document_type)
+            self.content_sources.append(chunk.content_source)
+
+    def search(self, query_embedding: Sequence[float], top_k: int = 5) -> List[SearchResult]:
+        """Return the ``top_k`` chunks with the highest inner-product score.
+
+        The query stays float32. Codes are widened to float32 one block of
+        rows at a time so the product runs through BLAS without a full-size
+        temporary, then each row is rescaled by its scale.
+        """
+        if not self._size or top_k <= 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        codes, scales = self.codes, self.scales
+        scores = np.empty(self._size, dtype=np.float32)
+        for start in range(0, self._size, self.SEARCH_BLOCK_ROWS):
+            stop = start + self.SEARCH_BLOCK_ROWS
+            block = codes[start:stop].astype(np.float32)
+            np.multiply(block @ query, scales[start:stop], out=scores[start:stop])
+        top_k = min(top_k, self._size)
+        best = np.argpartition(-scores, top_k - 1)[:top_k]
+        best = best[np.argsort(-scores[best])]
+
+        now = datetime.now()
+        return [
+            SearchResult(
+                content=self.contents[i],
+                source=self.sources[i],
+                score=float(scores[i]),
+                chunk_id=self.chunk_ids[i],
+                metadata=self.metadata[i],
+                document_type=self.document_types[i],
+                content_source=self.content_sources[i],
+                timestamp=now,
+            )
+            for i in best
+        ]
+
+    def build_faiss_index(self, index_type: Optional[str] = None,
+                          nprobe: Optional[int] = None) -> faiss.Index:
+        """Build a FAISS index over the stored embeddings; row ids match this store."""
+        return build_faiss_index(self.embeddings, index_type, nprobe)
+
+    def save(self, directory: Optional[Union[str, Path]] = None):
+        """Save codes and scales as ``<name>.npz`` and the metadata columns as ``<name>.json``."""
+        if directory is None:
+            Config.ensure_dirs()
+            directory = Config.FAISS_INDEX_PATH_STR
+        prefix = os.path.join(directory, self.name)
+
+        np.savez(f"{prefix}.npz", codes=self.codes, scales=self.scales)
+        columns = {
+            'dimension': self.dimension,
+            'chunk_ids': self.chunk_ids,
+            'contents': self.contents,
+            'sources': self.sources,
+            'metadata': self.metadata,
+            'document_types': [t.value for t in self.document_types],
+            'content_sources': [s.value for s in self.content_sources],
+        }
+        with open(f"{prefix}.json", 'w', encoding='utf-8') as f:
+            json.dump(columns, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, name: str = "documents",
+             directory: Optional[Union[str, Path]] = None) -> 'ChunkStore':
+        """Load a store previously written by ``save``."""
+        prefix = os.path.join(directory if directory is not None else Config.FAISS_INDEX_PATH_STR, name)
+
+        with open(f"{prefix}.json", 'r', encoding='utf-8') as f:
+            columns = json.load(f)
+        with np.load(f"{prefix}.npz") as arrays:
+            codes, scales = arrays['codes'], arrays['scales']
+
+        store = cls(name=name, dimension=columns['dimension'])
+        store._reserve(len(codes))
+        store._codes[:len(codes)] = codes
+        store._scales[:len(scales)] = scales
+        store._size = len(codes)
+        store.chunk_ids = columns['chunk_ids']
+        store.contents = columns['contents']
+        store.sources = columns['sources']
+        store.metadata = columns['metadata']
+        store.document_types = [_DOC_TYPE_BY_VALUE.get(v, DocumentType.UNKNOWN)
+                                for v in columns['document_types']]
+        store.content_sources = [_CONTENT_SOURCE_BY_VALUE.get(v, ContentSource.LOCAL_DOCUMENT)
+                                 for v in columns['content_sources']]
+        return store
@@ -0,0 +1,5 @@
+"""Make the project root importable (config.py and the src package)."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
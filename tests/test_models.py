@@ -0,0 +1,42 @@
+"""Tests for model serialization helpers in src/models.py."""
+import json
+
+import pytest
+
+from src.models import (
+    DocumentChunk,
+    load_document_chunks_from_binary,
+    load_document_chunks_from_json,
+    save_models_binary,
+    save_models_to_json,
+)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_load_document_chunks_from_empty_json(tmp_path, workers):
+    path = tmp_path / "chunks.json"
+    save_models_to_json([], str(path))
+
+    assert load_document_chunks_from_json(str(path), workers=workers) == []
+
+
+def test_parallel_load_preserves_chunk_order(tmp_path):
+    chunks = [DocumentChunk(f"content {i}", f"doc{i}.md", str(i)) for i in range(25)]
+    path = tmp_path / "chunks.json"
+    save_models_to_json(chunks, str(path))
+
+    loaded = load_document_chunks_from_json(str(path), workers=3)
+
+    assert [chunk.chunk_id for chunk in loaded] == [str(i) for i in range(25)]
+    assert loaded == load_document_chunks_from_json(str(path))
+
+
+def test_chunk_to_dict_is_json_safe_and_binary_round_trips(tmp_path):
+    chunk = DocumentChunk("a b c", "doc.md", "1", embedding=[0.5, -0.25, 1.0])
+
+    restored = DocumentChunk.from_dict(json.loads(json.dumps(chunk.to_dict())))
+    path = tmp_path / "chunks.msgpack"
+    save_models_binary([chunk], str(path))
+
+    assert restored.embedding == pytest.approx(chunk.embedding, abs=1 / 254)
+    assert load_document_chunks_from_binary(str(path)) == [restored]
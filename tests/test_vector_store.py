@@ -0,0 +1,76 @@
+"""Tests for the column-oriented ChunkStore in src/vector_store.py."""
+import json
+
+import numpy as np
+
+from src.models import ContentSource, DocumentChunk, DocumentType
+from src.vector_store import ChunkStore
+
+
+def _chunks(embeddings):
+    return [DocumentChunk(f"content {i}", f"doc{i}.pdf", str(i), embedding=list(row))
+            for i, row in enumerate(embeddings)]
+
+
+def test_extend_grows_past_initial_capacity():
+    count = ChunkStore.INITIAL_CAPACITY + 5
+    embeddings = np.random.default_rng(0).standard_normal((count, 8))
+    store = ChunkStore(dimension=8)
+
+    store.extend(_chunks(embeddings[:10]))
+    store.extend(_chunks(embeddings[10:]))
+
+    assert len(store) == count
+    assert len(store.codes) == count
+    assert len(store.chunk_ids) == count
+    np.testing.assert_allclose(store.embeddings, embeddings, atol=np.abs(embeddings).max() / 254)
+
+
+def test_search_ranks_like_brute_force_float32():
+    rng = np.random.default_rng(1)
+    embeddings = rng.standard_normal((300, 16))
+    query = rng.standard_normal(16)
+    store = ChunkStore(dimension=16)
+    store.extend(_chunks(embeddings))
+
+    results = store.search(query, top_k=5)
+
+    expected = np.argsort(-(embeddings.astype(np.float32) @ query.astype(np.float32)))[:5]
+    assert [r.chunk_id for r in results] == [str(i) for i in expected]
+    assert store.search(query, top_k=0) == []
+    assert store.search(query, top_k=-1) == []
+
+
+def test_save_load_round_trip_with_legacy_enum_values(tmp_path):
+    embeddings = np.random.default_rng(2).standard_normal((3, 4))
+    store = ChunkStore(name="docs", dimension=4)
+    store.extend(_chunks(embeddings))
+    store.save(tmp_path)
+
+    columns_file = tmp_path / "docs.json"
+    columns = json.loads(columns_file.read_text(encoding="utf-8"))
+    columns["document_types"] = ["pdf", "markdown", "bogus"]
+    columns["content_sources"] = ["web_scrape", 1, "bogus"]
+    columns_file.write_text(json.dumps(columns), encoding="utf-8")
+
+    loaded = ChunkStore.load("docs", tmp_path)
+
+    assert len(loaded) == 3
+    np.testing.assert_array_equal(loaded.codes, store.codes)
+    np.testing.assert_array_equal(loaded.scales, store.scales)
+    assert loaded.chunk_ids == store.chunk_ids
+    assert loaded.document_types == [DocumentType.PDF, DocumentType.MD, DocumentType.UNKNOWN]
+    assert loaded.content_sources == [ContentSource.WEB_SCRAPE, ContentSource.LOCAL_DOCUMENT,
+                                      ContentSource.LOCAL_DOCUMENT]
+
+
+def test_flat_faiss_index_matches_store_search():
+    rng = np.random.default_rng(3)
+    store = ChunkStore(dimension=16)
+    store.extend(_chunks(rng.standard_normal((200, 16))))
+    query = rng.standard_normal(16).astype(np.float32)
+
+    index = store.build_faiss_index("Flat")
+    _, ids = index.search(query[None, :], 5)
+
+    assert [str(i) for i in ids[0]] == [r.chunk_id for r in store.search(query, top_k=5)]